@@ -18,10 +18,14 @@ maintaining the standard LLM interface.
 """
 
 import argparse
-import asyncio
+import io
+from collections import deque
 from typing import Any, AsyncGenerator
 
+from pydantic import Field
+
 from langchain_wrappers import ChatWrapper
+from examples.utils.loop_utils import run
 from examples.utils.provider_utils import (
     create_llm_wrapper,
     add_provider_arguments
@@ -31,24 +35,26 @@ from examples.workflow import WorkflowQA
 
 class CapturingLLM(ChatWrapper):
     underlying_llm: ChatWrapper = None
-    history: list[dict[str, Any]] = []
+    # Only the most recent records are kept so long-running processes stay bounded
+    history: deque[dict[str, Any]] = Field(default_factory=lambda: deque(maxlen=1024))
 
     def __init__(self, underlying_llm: ChatWrapper, **kwargs):
         super().__init__(**kwargs)
         self.underlying_llm = underlying_llm
-        self.history = []
     
     async def query(self, **kwargs) -> AsyncGenerator[str, None]:
-        record = {
-            "input": kwargs,
-            "output": []
-        }
+        # Chunks are written straight into the buffer; the text is only built on read
+        output = io.StringIO()
 
-        async for chunk in self.underlying_llm.query(**kwargs):
-            record["output"].append(chunk)
-            yield chunk
-        
-        self.history.append(record)
+        try:
+            async for chunk in self.underlying_llm.query(**kwargs):
+                output.write(chunk)
+                yield chunk
+        finally:
+            self.history.append({
+                "input": kwargs,
+                "output": output
+            })
 
 
 async def main():
@@ -71,8 +77,8 @@ async def main():
         print("-"*80)
         print("Input arguments:", record["input"])
         print('')
-        print("Output:", "".join(record["output"]))
+        print("Output:", record["output"].getvalue())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
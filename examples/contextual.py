@@ -19,13 +19,13 @@ without the caller needing to handle it explicitly.
 """
 
 import argparse
-import asyncio
 import inspect
 import sys
 import traceback
 from typing import AsyncGenerator
 
 from langchain_wrappers import LLMDecorator
+from examples.utils.loop_utils import run
 from examples.utils.provider_utils import (
     create_llm_wrapper,
     add_provider_arguments
@@ -123,4 +123,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
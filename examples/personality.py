@@ -3,8 +3,8 @@
 This example demonstrates creating an LLM Facade that always responds in simplified
 language suitable for a young audience (ELI5 - "Explain Like I'm 5"). The ELI5 facade:
 
-- Takes any input query and first gets a normal response
-- Then automatically simplifies that response into child-friendly language
+- Takes any input query and answers it directly in child-friendly language
+- Does this in a single LLM call, rather than answering first and simplifying after
 - Maintains this simplified style across all interface methods (streaming, structured, etc.)
 
 This pattern is useful for:
@@ -19,22 +19,33 @@ the caller needing to handle it explicitly.
 """
 
 import argparse
-import asyncio
 from typing import AsyncGenerator
 
 from langchain_wrappers import LLMDecorator
+from examples.utils.loop_utils import run
 from examples.utils.provider_utils import (
     create_llm_wrapper,
     add_provider_arguments
 )
 
 
+# Passed as the first prompt arg so the constant text forms a cacheable prompt prefix
+TASK_ELI5 = (
+    "Respond to the user's request, given in USER_ARGS if present and otherwise in the "
+    "earlier messages of the conversation, at a level that is easy to understand for a "
+    "5 year old. Do not give an adult-level answer first."
+)
+
+
 class ELI5(LLMDecorator):
     async def hook_query(self, prompt_args: dict[str, str], api_args: dict[str, str]) -> AsyncGenerator[tuple[dict[str, str], dict[str, str]], str]:
-        initial_response = await self.underlying_llm.query_response(**prompt_args, **api_args)
+        # Plain langchain calls (e.g., invoke) carry the request in messages, not prompt args
+        eli5_args = {"TASK": TASK_ELI5}
+        if prompt_args:
+            eli5_args["USER_ARGS"] = prompt_args
+
         response = yield {
-            "CONTENT": initial_response,
-            "TASK": "ELI5 the CONTENT. In other words, rephrase the CONTENT in a way that is easy to understand for a 5 year old.",
+            **eli5_args,
             **api_args
         }
 
@@ -61,4 +72,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Event loop utility module for langchain-wrappers examples.
+
+This module provides a drop-in replacement for asyncio.run that uses uvloop when
+it is installed. uvloop lowers the per-task scheduling overhead of the many
+concurrent LLM streams the examples run, and is unavailable on some platforms
+(e.g., Windows), so the standard event loop is used as a fallback. Pooled
+provider connections are closed before the loop shuts down.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+from examples.utils.provider_utils import close_http_connections
+
+# For uvloop support
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, using uvloop if it is available.
+    
+    Args:
+        main (Coroutine): The coroutine to run
+        
+    Returns:
+        The result of the coroutine
+    """
+    if not UVLOOP_AVAILABLE:
+        return asyncio.run(_run_and_close(main))
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(_run_and_close(main))
+
+
+async def _run_and_close(main: Coroutine[Any, Any, T]) -> T:
+    try:
+        return await main
+    finally:
+        await close_http_connections()
@@ -8,9 +8,14 @@ providers when running example scripts or benchmarks.
 """
 
 import argparse
+import asyncio
+import functools
 from typing import Optional
+from weakref import WeakKeyDictionary
 
-from langchain_wrappers import wrapper_from_chatmodel
+import httpx
+
+from langchain_wrappers import BatchingChatWrapper, wrapper_from_chatmodel
 
 # Import providers with error handling
 from langchain_openai import ChatOpenAI
@@ -29,6 +34,95 @@ try:
 except ImportError:
     GROQ_AVAILABLE = False
 
+# HTTP/2 requires the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+_DEFAULT_MODELS = {
+    "openai": "gpt-4o-mini",
+    "cerebras": "llama-3.3-70b",
+    "groq": "llama-3.3-70b-versatile",  # Groq's Llama 3.3 70B model
+}
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """Async transport that keeps a separate connection pool for each event loop.
+    
+    Pooled connections are bound to the loop that opened them, and wrappers are
+    driven from both the caller's loop and the background loop used by sync
+    calls, so each loop gets its own pool.
+    """
+
+    def __init__(self, **transport_args):
+        self._transport_args = transport_args
+        self._transports: WeakKeyDictionary = WeakKeyDictionary()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            # Pools reference their loop, so drop closed loops explicitly
+            for closed in [l for l in self._transports if l.is_closed()]:
+                del self._transports[closed]
+            transport = self._transports[loop] = httpx.AsyncHTTPTransport(**self._transport_args)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        current = asyncio.get_running_loop()
+        transports, self._transports = self._transports, WeakKeyDictionary()
+        for loop, transport in transports.items():
+            if loop is current:
+                await transport.aclose()
+            elif loop.is_running():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(transport.aclose(), loop)
+                )
+
+
+_http_transports: list[_PerLoopTransport] = []
+_http_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_async_client() -> httpx.AsyncClient:
+    """Get the async HTTP client shared by every provider chat model.
+    
+    Sharing one client lets connections (and their TLS sessions) be reused
+    across wrappers instead of each chat model opening its own. httpx ignores
+    environment proxies once a custom transport is given, so proxies from the
+    environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY, NO_PROXY) are mounted here.
+    
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    global _http_async_client
+    if _http_async_client is None:
+        transport_args = {
+            "http2": HTTP2_AVAILABLE,
+            "limits": httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        }
+        transport = _PerLoopTransport(**transport_args)
+        # A None mount routes matching URLs (e.g. from NO_PROXY) to the default transport
+        mounts = {
+            pattern: None if proxy is None else _PerLoopTransport(proxy=proxy, **transport_args)
+            for pattern, proxy in httpx._utils.get_environment_proxies().items()
+        }
+        _http_transports[:] = [transport, *filter(None, mounts.values())]
+        _http_async_client = httpx.AsyncClient(transport=transport, mounts=mounts, timeout=60)
+    return _http_async_client
+
+
+async def close_http_connections() -> None:
+    """Close the pooled connections of the shared HTTP client.
+    
+    The client itself stays usable; new connections are opened on demand.
+    """
+    for transport in _http_transports:
+        await transport.aclose()
+
 
 def get_default_model(provider: str) -> str:
     """Get the default model for the specified provider.
@@ -43,22 +137,27 @@ def get_default_model(provider: str) -> str:
         ValueError: If the provider is not supported
     """
     provider = provider.lower()
-    if provider == "openai":
-        return "gpt-4o-mini"
-    elif provider == "cerebras":
-        return "llama-3.3-70b"
-    elif provider == "groq":
-        return "llama-3.3-70b-versatile"  # Groq's Llama 3.1 8B model
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+    try:
+        return _DEFAULT_MODELS[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported provider: {provider}") from None
 
 
-def create_llm_wrapper(provider: str, model: Optional[str] = None, **provider_args):
+def create_llm_wrapper(
+    provider: str,
+    model: Optional[str] = None,
+    batch: bool = False,
+    max_concurrency: Optional[int] = None,
+    **provider_args
+):
     """Create an LLM wrapper based on provider and model.
     
     Args:
         provider (str): The name of the provider (openai, cerebras, groq)
         model (str, optional): The model name to use. If None, uses the default model.
+        batch (bool): Whether to batch concurrent non-streaming queries
+        max_concurrency (int, optional): Maximum number of in-flight requests to the
+            provider per event loop. Must be positive. If None, requests are not limited.
         **provider_args: Additional arguments to pass to the provider's constructor
         
     Returns:
@@ -74,6 +173,8 @@ def create_llm_wrapper(provider: str, model: Optional[str] = None, **provider_ar
     if model is None:
         model = get_default_model(provider)
     
+    provider_args.setdefault("http_async_client", _get_http_async_client())
+    
     if provider == "openai":
         chat_model = ChatOpenAI(model=model, **provider_args)
     elif provider == "cerebras":
@@ -87,14 +188,21 @@ def create_llm_wrapper(provider: str, model: Optional[str] = None, **provider_ar
     else:
         raise ValueError(f"Unsupported provider: {provider}. Supported providers are: openai, cerebras, groq")
     
-    return wrapper_from_chatmodel(chat_model)
+    wrapper = wrapper_from_chatmodel(chat_model, max_concurrency=max_concurrency)
+    if batch:
+        return BatchingChatWrapper(underlying_llm=wrapper)
 
+    return wrapper
 
-def get_available_providers():
-    """Get a list of available providers.
+
+@functools.cache
+def get_available_providers() -> tuple[str, ...]:
+    """Get the available providers.
+    
+    Availability is fixed at import time, so the result is computed once.
     
     Returns:
-        list: List of available provider names
+        tuple: Available provider names
     """
     providers = ["openai"]
     
@@ -104,7 +212,7 @@ def get_available_providers():
     if GROQ_AVAILABLE:
         providers.append("groq")
     
-    return providers
+    return tuple(providers)
 
 
 def add_provider_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
@@ -7,8 +7,9 @@ question answering into multiple coordinated steps. The WorkflowQA facade:
 2. Identifies key points to cover (task2) 
 3. Uses the gathered context to generate a comprehensive response
 
-Tasks 1 and 2 run in parallel to optimize performance. The facade then combines
-their outputs to inform the final response generation.
+Tasks 1 and 2 run in parallel to optimize performance, and each facade caches their
+results so repeated questions skip straight to step 3. The facade then combines their outputs
+to inform the final response generation.
 
 This pattern is useful for:
 - Breaking complex LLM tasks into coordinated subtasks
@@ -23,50 +24,130 @@ automatically without the caller needing to handle it explicitly.
 
 import argparse
 import asyncio
-from typing import AsyncGenerator
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, AsyncGenerator, Optional
+
+from pydantic import PrivateAttr
 
 from langchain_wrappers import LLMDecorator
+from langchain_wrappers.wrapper_utils import dumps_json
+from examples.utils.loop_utils import run
 from examples.utils.provider_utils import (
     create_llm_wrapper,
     add_provider_arguments
 )
 
 
+# Each TASK is passed as the first prompt arg so that the constant text starts the
+# prompt, giving providers with automatic prefix caching a reusable prefix.
+TASK_KNOWLEDGE = (
+    "Analyze the question posed by the user in the USER_ARGS. "
+    "Infer the user's knowledge level based on the request, and provide a statement of that level."
+)
+
+TASK_KEYPOINTS = (
+    "Analyze the question posed by the user in the USER_ARGS. "
+    "Identify the key points that need to be covered to answer the question, and provide a list of those key points."
+)
+
+TASK_SYNTHESIS = (
+    "Analyze the question posed by the user in the USER_ARGS. "
+    "Provide a comprehensive response to question posed by the user in USER_ARGS. "
+    "The response should be tailored to the KNOWLEDGE_LEVEL of the user. "
+    "The response should cover the KEY_POINTS that are relevant to the question. "
+)
+
+
+class LRUCache:
+    """Least-recently-used cache whose entries expire ttl seconds after insertion."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, value = entry
+        if monotonic() >= expires:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = (monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 class WorkflowQA(LLMDecorator):
+    # Per instance, since the analyses depend on the underlying LLM as well as the prompt args
+    _analysis_cache: LRUCache = PrivateAttr(default_factory=lambda: LRUCache(maxsize=256, ttl=3600))
+    _in_flight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = PrivateAttr(default_factory=dict)
+
     async def hook_query(self, prompt_args: dict[str, str], api_args: dict[str, str]) -> AsyncGenerator[tuple[dict[str, str], dict[str, str]], str]:
-        task1 = self.underlying_llm.query_block(
-            "text",
-            USER_ARGS=prompt_args,
-            TASK=(
-                "Analyze the question posed by the user in the USER_ARGS. "
-                "Infer the user's knowledge level based on the request, and provide a statement of that level."
-            )
-        )
-
-        task2 = self.underlying_llm.query_block(
-            "text",
-            USER_ARGS=prompt_args,
-            TASK=(
-                "Analyze the question posed by the user in the USER_ARGS. "
-                "Identify the key points that need to be covered to answer the question, and provide a list of those key points."
-            )
-        )
-
-        knowledge_level, key_points = await asyncio.gather(task1, task2)
+        cache_key = dumps_json(prompt_args, sort_keys=True)
+        analysis = self._analysis_cache.get(cache_key)
+        if analysis is None:
+            analysis = await self._shared_analysis(cache_key, prompt_args)
+
+        knowledge_level, key_points = analysis
 
         response = yield {
+            "TASK": TASK_SYNTHESIS,
             "KNOWLEDGE_LEVEL": knowledge_level,
             "KEY_POINTS": key_points,
             "USER_ARGS": prompt_args,
-            "TASK": (
-                "Analyze the question posed by the user in the USER_ARGS. "
-                "Provide a comprehensive response to question posed by the user in USER_ARGS. "
-                "The response should be tailored to the KNOWLEDGE_LEVEL of the user. "
-                "The response should cover the KEY_POINTS that are relevant to the question. "
-            ),
             **api_args
         }
 
+    async def _shared_analysis(self, cache_key: str, prompt_args: dict[str, str]) -> tuple[str, str]:
+        # Concurrent identical questions wait on one analysis instead of each starting their own
+        flight_key = (asyncio.get_running_loop(), cache_key)
+        task = self._in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.create_task(self._analyze(prompt_args))
+            self._in_flight[flight_key] = task
+
+            def finish(task: asyncio.Task) -> None:
+                del self._in_flight[flight_key]
+                if not task.cancelled() and task.exception() is None:
+                    self._analysis_cache.put(cache_key, task.result())
+
+            task.add_done_callback(finish)
+
+        # Shielded so one caller giving up doesn't cancel the analysis for the others
+        return await asyncio.shield(task)
+
+    async def _analyze(self, prompt_args: dict[str, str]) -> tuple[str, str]:
+        # Both analyses start immediately, and a failure in either cancels the other.
+        # Unwrap the TaskGroup's ExceptionGroup so callers see the original error.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                task1 = tg.create_task(self.underlying_llm.query_block(
+                    "text",
+                    TASK=TASK_KNOWLEDGE,
+                    USER_ARGS=prompt_args
+                ))
+
+                task2 = tg.create_task(self.underlying_llm.query_block(
+                    "text",
+                    TASK=TASK_KEYPOINTS,
+                    USER_ARGS=prompt_args
+                ))
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from eg
+
+        knowledge_level, key_points = task1.result(), task2.result()
+        return knowledge_level, key_points
+
 
 async def main():
     # Parse command line arguments
@@ -93,4 +174,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
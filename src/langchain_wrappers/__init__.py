@@ -2,3 +2,4 @@ from .chat_wrapper import ChatWrapper
 from .llm_decorator import LLMDecorator
 from .llm_wrapper import LLMWrapper
 from .langchain_wrapper import LangchainChatWrapper, wrapper_from_chatmodel
+from .batching_wrapper import BatchingChatWrapper
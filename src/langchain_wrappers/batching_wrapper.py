@@ -0,0 +1,131 @@
+import asyncio
+from typing import Any, AsyncGenerator, Optional
+from weakref import WeakKeyDictionary
+
+from pydantic import PrivateAttr
+
+from .chat_wrapper import ChatWrapper
+from .wrapper_utils import dumps_json
+
+__all__ = ["BatchingChatWrapper"]
+
+
+class _LoopState:
+    """Batching state for one event loop; asyncio queues and semaphores are loop-bound."""
+
+    def __init__(self, max_concurrency: int):
+        self.pending = asyncio.Queue()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.dispatcher: Optional[asyncio.Task] = None
+
+
+class BatchingChatWrapper(ChatWrapper):
+    """
+    Chat wrapper that limits and optionally merges concurrent non-streaming queries.
+
+    At most max_concurrency underlying calls run at once per event loop.
+    Streaming queries are passed through as-is.
+
+    With deduplicate=True, queries arriving within max_wait seconds of each
+    other, up to max_batch_size at a time, are collected and identical ones
+    share a single underlying call and all receive the same response. This is
+    off by default because sampled queries (temperature > 0) would otherwise
+    stop returning independent completions. Without it, queries are sent
+    straight away and never wait for a batch.
+
+    Each query is still its own request to the provider; this is not a
+    provider batch API (e.g. OpenAI's Batch API).
+    """
+
+    underlying_llm: ChatWrapper = None
+    max_batch_size: int = 16
+    max_wait: float = 0.01
+    max_concurrency: int = 8
+    deduplicate: bool = False
+
+    _loops: WeakKeyDictionary = PrivateAttr(default_factory=WeakKeyDictionary)
+    _running: set = PrivateAttr(default_factory=set)
+
+    def __init__(self, underlying_llm: ChatWrapper, **kwargs):
+        super().__init__(**kwargs)
+        self.underlying_llm = underlying_llm
+
+    async def query(self, **kwargs) -> AsyncGenerator[str, None]:
+        if kwargs.get("stream", False):
+            async for chunk in self.underlying_llm.query(**kwargs):
+                yield chunk
+            return
+
+        state = self._get_loop_state()
+        if not self.deduplicate:
+            # Nothing to merge, so don't hold the query back for a batch window
+            async with state.semaphore:
+                result = "".join(
+                    [chunk async for chunk in self.underlying_llm.query(**kwargs)]
+                )
+            yield result
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        state.pending.put_nowait((kwargs, future))
+        if state.dispatcher is None or state.dispatcher.done():
+            state.dispatcher = asyncio.create_task(self._dispatch(state))
+
+        yield await future
+
+    def _get_loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            # Entries reference their loop, so drop closed loops explicitly
+            for closed in [l for l in self._loops if l.is_closed()]:
+                del self._loops[closed]
+            state = self._loops[loop] = _LoopState(self.max_concurrency)
+
+        return state
+
+    async def _dispatch(self, state: _LoopState) -> None:
+        # Runs until the queue drains, so no dispatcher outlives its work
+        loop = asyncio.get_running_loop()
+
+        while not state.pending.empty():
+            batch = [state.pending.get_nowait()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(state.pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: dict[str, tuple[dict[str, Any], list[asyncio.Future]]] = {}
+            for kwargs, future in batch:
+                key = dumps_json(kwargs, sort_keys=True)
+                groups.setdefault(key, (kwargs, []))[1].append(future)
+
+            for kwargs, futures in groups.values():
+                task = loop.create_task(self._run(state.semaphore, kwargs, futures))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+    async def _run(
+        self,
+        semaphore: asyncio.Semaphore,
+        kwargs: dict[str, Any],
+        futures: list[asyncio.Future],
+    ) -> None:
+        try:
+            async with semaphore:
+                result = "".join(
+                    [chunk async for chunk in self.underlying_llm.query(**kwargs)]
+                )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
@@ -1,4 +1,3 @@
-import json
 from abc import ABC, abstractmethod
 from typing import Any, AsyncGenerator, Type, TypeVar, Union
 
@@ -7,7 +6,12 @@ from pydantic import BaseModel, TypeAdapter
 
 
 from .llm_wrapper import LLMWrapper
-from .wrapper_utils import compile_user_prompt, parse_block_response, parse_obj_response
+from .wrapper_utils import (
+    compile_user_prompt,
+    dumps_json,
+    parse_block_response,
+    parse_obj_response,
+)
 
 __all__ = ["ChatWrapper"]
 
@@ -181,7 +185,7 @@ async def _generate_obj_query_messages(
     system_prompt = (
         "Your task is to understand the content and provide "
         "the parsed objects in json that matches the following json_schema:\n\n"
-        f"{json.dumps(schema, indent=2)}\n\n"
+        f"{dumps_json(schema, indent=True)}\n\n"
         "Make sure to return an instance of the JSON, not the schema itself."
     )
 
@@ -1,20 +1,99 @@
+import asyncio
+from contextlib import nullcontext
 from langchain_core.language_models import BaseChatModel
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+from weakref import WeakKeyDictionary
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
+
+try:
+    from importlib.metadata import version
+    from langchain_openai.chat_models.base import BaseChatOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+# The native-client bypass relies on BaseChatOpenAI internals, so it's only enabled
+# for the langchain-openai releases it's been tested against (>=0.3.7,<0.4).
+OPENAI_BYPASS_SUPPORTED = OPENAI_AVAILABLE and (0, 3, 7) <= tuple(
+    int(part) for part in version("langchain-openai").split(".")[:3] if part.isdigit()
+) < (0, 4)
 
 
 from .chat_wrapper import ChatWrapper
+from .wrapper_utils import coalesce_chunks
 
 class LangchainChatWrapper(ChatWrapper):
     llm: BaseChatModel = Field(default=None)
+    # Maximum number of in-flight queries per event loop (None means unlimited).
+    # asyncio semaphores are bound to a single loop, so sync callers (which run on
+    # the shared background loop) and async callers are limited separately, and the
+    # total across loops can reach max_concurrency times the number of loops.
+    max_concurrency: Optional[int] = Field(default=None, gt=0)
+
+    _semaphores: WeakKeyDictionary = PrivateAttr(default_factory=WeakKeyDictionary)
 
     async def query(self, **kwargs) -> AsyncGenerator[str, None]:
-        if kwargs.get("stream", False):
-            async for chunk in self.llm.astream(kwargs["messages"]):
-                yield chunk.content
-        else:
-            yield self.llm.invoke(kwargs["messages"]).content
-
-def wrapper_from_chatmodel(llm: BaseChatModel) -> LangchainChatWrapper:
-    return LangchainChatWrapper(llm=llm)
+        async with self._concurrency_limit():
+            if kwargs.get("stream", False):
+                payload = _openai_payload(self.llm, kwargs["messages"])
+                if payload is not None:
+                    contents = self._openai_stream(payload)
+                else:
+                    contents = (chunk.content async for chunk in self.llm.astream(kwargs["messages"]))
+                async for chunk in coalesce_chunks(contents):
+                    yield chunk
+            else:
+                message = await self.llm.ainvoke(kwargs["messages"])
+                yield message.content
+
+    def _concurrency_limit(self):
+        if self.max_concurrency is None:
+            return nullcontext()
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # Semaphores reference their loop once used, so drop closed loops explicitly
+            for closed in [l for l in self._semaphores if l.is_closed()]:
+                del self._semaphores[closed]
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _openai_stream(self, payload: dict) -> AsyncGenerator[str, None]:
+        # Stream from the openai SDK directly, skipping LangChain's per-token callbacks
+        payload = {**payload, "stream": True}
+        async for chunk in await self.llm.async_client.create(**payload):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+def _openai_payload(llm: BaseChatModel, messages) -> Optional[dict]:
+    """
+    Build a Chat Completions payload for streaming through the native client.
+
+    Returns None when the model should go through LangChain instead: when it
+    isn't OpenAI-based, would be sent to the Responses API, reports streamed
+    token usage, or has callbacks or a rate limiter configured (all of which
+    LangChain's own streaming handles).
+    """
+    if not (
+        OPENAI_BYPASS_SUPPORTED
+        and isinstance(llm, BaseChatOpenAI)
+        and getattr(llm, "async_client", None) is not None
+        and not getattr(llm, "stream_usage", False)
+        and not getattr(llm, "callbacks", None)
+        and getattr(llm, "rate_limiter", None) is None
+    ):
+        return None
+
+    payload = llm._get_request_payload(messages)
+    # Releases without _use_responses_api predate the Responses API and always
+    # use Chat Completions
+    use_responses_api = getattr(llm, "_use_responses_api", None)
+    if use_responses_api is not None and use_responses_api(payload):
+        return None
+
+    return payload
+
+def wrapper_from_chatmodel(llm: BaseChatModel, max_concurrency: Optional[int] = None) -> LangchainChatWrapper:
+    return LangchainChatWrapper(llm=llm, max_concurrency=max_concurrency)
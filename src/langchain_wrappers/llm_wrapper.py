@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, AsyncGenerator, Generator, Optional, Type, TypeVar, Union
+from contextlib import contextmanager
+import os
+import sys
+import threading
+from typing import Any, AsyncGenerator, Generator, Iterator, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -14,6 +17,81 @@ from langchain_core.outputs import ChatResult, ChatGeneration, ChatGenerationChu
 T = TypeVar("T", bound=BaseModel)
 S = TypeVar("S", bound=Union[str, T])
 
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_thread: Optional[threading.Thread] = None
+_bg_loop_lock = threading.Lock()
+
+# How long a sync stream waits for its async stream to close before giving up
+_STREAM_CLOSE_TIMEOUT = 5
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared background event loop used to run sync calls.
+
+    The loop is created on first use and runs forever in a daemon thread, so
+    every sync invocation shares one loop instead of building its own.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop
+    """
+    global _bg_loop, _bg_thread
+
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="llm-wrapper-loop", daemon=True
+            )
+            thread.start()
+            _bg_loop, _bg_thread = loop, thread
+
+    return _bg_loop
+
+
+def _reset_bg_loop() -> None:
+    # A forked child inherits the loop object but not the thread running it
+    global _bg_loop, _bg_thread, _bg_loop_lock
+
+    _bg_loop = None
+    _bg_thread = None
+    _bg_loop_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_bg_loop)
+
+
+@contextmanager
+def _sync_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """
+    Provide the event loop a sync call should submit its coroutines to.
+
+    This is normally the shared background loop. A sync call made from code
+    already running on that loop (e.g. a wrapper whose async query invokes
+    another wrapper synchronously) would block the loop it waits on, so it
+    gets a private loop on its own thread instead.
+
+    Yields:
+        asyncio.AbstractEventLoop: A running loop on another thread
+    """
+    if threading.current_thread() is not _bg_thread:
+        yield _get_bg_loop()
+        return
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_forever, name="llm-wrapper-nested-loop", daemon=True
+    )
+    thread.start()
+    try:
+        yield loop
+    finally:
+        asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
 
 class LLMWrapper(BaseChatModel, ABC):
     """
@@ -92,14 +170,10 @@ class LLMWrapper(BaseChatModel, ABC):
         stop: Optional[list[str]] = None,
         run_manager: Optional[CallbackManagerForLLMRun] = None,
     ) -> ChatResult:
-        def run_in_thread():
-            new_loop = asyncio.new_event_loop()
-            return new_loop.run_until_complete(
-                self._agenerate(messages, stop, run_manager)
+        with _sync_loop() as loop:
+            future = asyncio.run_coroutine_threadsafe(
+                self._agenerate(messages, stop, run_manager), loop
             )
-        
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(run_in_thread)
             return future.result()
 
             
@@ -120,27 +194,28 @@ class LLMWrapper(BaseChatModel, ABC):
     
 
     def _stream(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, run_manager: Optional[CallbackManagerForLLMRun] = None) -> Generator[ChatGenerationChunk, None, None]:
-        from queue import Queue
-        queue = Queue()
-        completion_obj = object()
-        
-        async def process_stream():
-            async for chunk in self._astream(messages, stop, run_manager):
-                queue.put(chunk)
-            queue.put(completion_obj)  # Signal completion
-            
-        def run_in_thread():
-            new_loop = asyncio.new_event_loop()
-            return new_loop.run_until_complete(process_stream())
-        
-        thread = ThreadPoolExecutor().submit(run_in_thread)
-        
-        while True:
-            item = queue.get()
-            if item is completion_obj:
-                break
-            yield item
-                
+        with _sync_loop() as loop:
+            stream = self._astream(messages, stop, run_manager).__aiter__()
+
+            try:
+                while True:
+                    try:
+                        chunk = asyncio.run_coroutine_threadsafe(
+                            stream.__anext__(), loop
+                        ).result()
+                    except StopAsyncIteration:
+                        break
+                    yield chunk
+            finally:
+                # Release the underlying stream if the caller stops early. During
+                # interpreter shutdown the loop thread may never run again, so skip it.
+                if not sys.is_finalizing() and loop.is_running():
+                    try:
+                        asyncio.run_coroutine_threadsafe(stream.aclose(), loop).result(
+                            timeout=_STREAM_CLOSE_TIMEOUT
+                        )
+                    except TimeoutError:
+                        pass
 
     async def _astream(self, messages: list[BaseMessage], stop: Optional[list[str]] = None, run_manager: Optional[CallbackManagerForLLMRun] = None) -> AsyncGenerator[str, None]:
         async for chunk in self.query_stream(messages=messages):
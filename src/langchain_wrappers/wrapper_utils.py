@@ -1,9 +1,18 @@
+import asyncio
 import json
-from typing import Any, Type, TypeVar
+from contextlib import suppress
+from typing import Any, AsyncGenerator, AsyncIterable, Type, TypeVar
 from xml.sax.saxutils import escape as xml_escape
 
 from pydantic import BaseModel, TypeAdapter
 
+# orjson is optional; it's only used to speed up JSON encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 T = TypeVar("T")
 
 
@@ -109,6 +118,111 @@ async def compile_user_prompt(**kwargs) -> str:
     return "\n\n".join(prompt_pieces)
 
 
+def dumps_json(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Uses orjson when it is installed and the standard json module otherwise.
+    Values that are not JSON-serializable are converted with str().
+
+    Args:
+        obj: The object to serialize.
+        indent (bool): Whether to indent the output by two spaces.
+        sort_keys (bool): Whether to sort dictionary keys.
+
+    Returns:
+        str: The JSON string representation of the object.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, default=str)
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterable[str], max_chars: int = 4096, max_delay: float = 0.025
+) -> AsyncGenerator[str, None]:
+    """
+    Merge a stream of small text chunks into fewer, larger chunks.
+
+    The first chunk is yielded as soon as it arrives so time-to-first-token is
+    unaffected. After that, buffered chunks are flushed once they hold at least
+    max_chars characters or once max_delay seconds have passed since the first
+    buffered chunk, even if the stream has stalled. Anything left over is
+    flushed when the stream ends or before an error from it is raised.
+
+    Args:
+        chunks: The stream of text chunks to merge.
+        max_chars (int): Flush once this many characters are buffered.
+        max_delay (float): Flush once the oldest buffered chunk is this old.
+
+    Yields:
+        str: The merged text chunks.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    buffer = []
+    size = 0
+    deadline = 0.0
+    first = True
+    next_chunk = None
+
+    try:
+        while True:
+            if next_chunk is None:
+                next_chunk = asyncio.ensure_future(iterator.__anext__())
+
+            # Only wait past the deadline when there's nothing buffered to flush
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            done, _ = await asyncio.wait((next_chunk,), timeout=timeout)
+            if not done:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+                continue
+
+            task, next_chunk = next_chunk, None
+            if task.exception() is not None and buffer:
+                # Hand over what was already received before the source's error propagates
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                break
+
+            if not chunk:
+                continue
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(chunk)
+            size += len(chunk)
+
+            if first or size >= max_chars:
+                first = False
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        # Stop reading ahead if the caller closes the stream early
+        if next_chunk is not None:
+            next_chunk.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await next_chunk
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
 def parse_obj_response(response_model: Type[T], content: str) -> T:
     """
     Parse an object response from the LLM.